@@ -4,8 +4,84 @@ ascii.py
 Provides a class for rendering ASCII art using the Rich library.
 """
 
-from rich.console import Console
-from rich.panel import Panel
+import builtins
+import os
+import shutil
+import sys
+from functools import cached_property
+from typing import TYPE_CHECKING, TextIO
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+
+_ASCII_ART: str = r"""
+              _____   ______                       _
+        /\   |_   _| |  ____|                     (_)
+       /  \    | |   | |__ ___  _ __ ___ _ __  ___ _  ___ ___
+      / /\ \   | |   |  __/ _ \| '__/ _ \ '_ \/ __| |/ __/ __|
+     / ____ \ _| |_  | | | (_) | | |  __/ | | \__ \ | (__\__ \
+    /_/    \_\_____| |_|  \___/|_|  \___|_| |_|___/_|\___|___/
+
+
+        """
+
+# The banner panel as Rich renders it to a non-terminal stream, pre-rendered so
+# piped or redirected output needs neither a Console nor a Panel.
+_BANNER: str = r"""╭────────────────────────────────────────────────────────────────╮
+│                                                                │
+│               _____   ______                       _           │
+│         /\   |_   _| |  ____|                     (_)          │
+│        /  \    | |   | |__ ___  _ __ ___ _ __  ___ _  ___ ___  │
+│       / /\ \   | |   |  __/ _ \| '__/ _ \ '_ \/ __| |/ __/ __| │
+│      / ____ \ _| |_  | | | (_) | | |  __/ | | \__ \ | (__\__ \ │
+│     /_/    \_\_____| |_|  \___/|_|  \___|_| |_|___/_|\___|___/ │
+│                                                                │
+│                                                                │
+│                                                                │
+╰────────────────────── Inspect Ai Models ───────────────────────╯
+"""
+
+_BANNER_WIDTH: int = max(len(line) for line in _BANNER.splitlines())
+
+# Environment variables that make Rich treat a redirected stream as a terminal.
+_RICH_TERMINAL_OVERRIDES: tuple[str, ...] = ("FORCE_COLOR", "TTY_COMPATIBLE")
+
+
+def _banner_panel() -> "Panel":
+    """
+    Builds the Rich panel that frames the ASCII art.
+    """
+    from rich.panel import Panel  # pylint: disable=import-outside-toplevel
+
+    return Panel.fit(
+        _ASCII_ART, title=None, subtitle="Inspect Ai Models", border_style="bold green"
+    )
+
+
+def _prints_as_banner(stream: TextIO | None) -> bool:
+    """
+    Checks whether Rich would render the panel to ``stream`` exactly as ``_BANNER``.
+
+    Mirrors the parts of Rich 14's ``Console`` that affect the output: the
+    stream must exist and not be a terminal, be UTF encoded and be wider than
+    the panel, with no terminal override set and outside IPython. The extra
+    column leaves room for the one Rich reserves on legacy Windows consoles.
+    """
+    stream = getattr(stream, "rich_proxied_file", stream)
+    if stream is None or hasattr(builtins, "get_ipython"):
+        return False
+    if any(name in os.environ for name in _RICH_TERMINAL_OVERRIDES):
+        return False
+    if not (getattr(stream, "encoding", None) or "utf-8").lower().startswith("utf"):
+        return False
+    isatty = getattr(stream, "isatty", None)
+    try:
+        if isatty is None or isatty():
+            return False
+    except ValueError:
+        return False
+    return shutil.get_terminal_size().columns > _BANNER_WIDTH
 
 
 class AsciiArtDisplayer:
@@ -13,27 +89,25 @@ class AsciiArtDisplayer:
     A class to handle displaying ASCII art using the Rich library.
     """
 
-    def __init__(self) -> None:
+    @cached_property
+    def console(self) -> "Console":
         """
-        Initializes the console for Rich output.
+        The console used for Rich output, created on first use.
         """
-        self.console = Console()
+        # Rich is imported lazily so non-interactive runs never load it.
+        from rich.console import Console  # pylint: disable=import-outside-toplevel
+
+        return Console()
 
     def display(self) -> None:
         """
         Displays ASCII art within a styled Rich panel.
-        """
-        art: str = r"""
-              _____   ______                       _
-        /\   |_   _| |  ____|                     (_)
-       /  \    | |   | |__ ___  _ __ ___ _ __  ___ _  ___ ___
-      / /\ \   | |   |  __/ _ \| '__/ _ \ '_ \/ __| |/ __/ __|
-     / ____ \ _| |_  | | | (_) | | |  __/ | | \__ \ | (__\__ \
-    /_/    \_\_____| |_|  \___/|_|  \___|_| |_|___/_|\___|___/
-
 
+        When Rich would print plain text to stdout anyway, the pre-rendered
+        banner is written directly instead. A console that has already been
+        created, or assigned by the caller, is always used as is.
         """
-        panel: Panel = Panel.fit(
-            art, title=None, subtitle="Inspect Ai Models", border_style="bold green"
-        )
-        self.console.print(panel)
+        if "console" not in self.__dict__ and _prints_as_banner(sys.stdout):
+            sys.stdout.write(_BANNER)
+            return
+        self.console.print(_banner_panel())
@@ -0,0 +1,142 @@
+"""
+Tests for the ASCII art banner.
+"""
+
+import io
+import sys
+
+import pytest
+from rich.console import Console
+
+from ai_forensics.ascii import (
+    _BANNER,
+    _BANNER_WIDTH,
+    _RICH_TERMINAL_OVERRIDES,
+    AsciiArtDisplayer,
+    _banner_panel,
+    _prints_as_banner,
+)
+
+
+@pytest.fixture(autouse=True)
+def plain_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Clears environment variables that change how Rich renders the banner.
+    """
+    for name in (*_RICH_TERMINAL_OVERRIDES, "NO_COLOR"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("COLUMNS", "80")
+
+
+def _redirect_stdout(monkeypatch: pytest.MonkeyPatch, encoding: str) -> io.BytesIO:
+    """
+    Replaces stdout with a non-terminal stream using ``encoding``.
+    """
+    buffer = io.BytesIO()
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(buffer, encoding=encoding))
+    return buffer
+
+
+def _display(monkeypatch: pytest.MonkeyPatch, encoding: str) -> tuple[AsciiArtDisplayer, str]:
+    """
+    Displays the banner to a redirected stdout and returns what was written.
+    """
+    buffer = _redirect_stdout(monkeypatch, encoding)
+    displayer = AsciiArtDisplayer()
+    displayer.display()
+    sys.stdout.flush()
+    return displayer, buffer.getvalue().decode(encoding)
+
+
+def test_banner_matches_rich_render() -> None:
+    """
+    The pre-rendered banner must stay identical to Rich's plain-text panel.
+    """
+    output = io.StringIO()
+    Console(file=output, width=80).print(_banner_panel())
+    assert output.getvalue() == _BANNER
+
+
+def test_display_writes_banner_without_console(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    A non-terminal UTF-8 stdout gets the pre-rendered banner.
+    """
+    displayer, output = _display(monkeypatch, "utf-8")
+    assert output == _BANNER
+    assert "console" not in displayer.__dict__
+
+
+def test_display_uses_ascii_box_for_non_utf8(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Streams that cannot encode box-drawing characters fall back to Rich.
+    """
+    _, output = _display(monkeypatch, "latin-1")
+    assert output.startswith("+")
+    assert "Inspect Ai Models" in output
+    assert output.isascii()
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [("FORCE_COLOR", "1"), ("TTY_COMPATIBLE", "1"), ("COLUMNS", "40")],
+)
+def test_display_defers_to_rich_on_overrides(
+    monkeypatch: pytest.MonkeyPatch, name: str, value: str
+) -> None:
+    """
+    Environment settings that Rich honours bypass the pre-rendered banner.
+    """
+    monkeypatch.setenv(name, value)
+    displayer, output = _display(monkeypatch, "utf-8")
+    assert output != _BANNER
+    assert "console" in displayer.__dict__
+
+
+def test_display_uses_assigned_console(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    A console set by the caller receives the panel instead of stdout.
+    """
+    buffer = _redirect_stdout(monkeypatch, "utf-8")
+    output = io.StringIO()
+    displayer = AsciiArtDisplayer()
+    displayer.console = Console(file=output, force_terminal=True, width=80)
+    displayer.display()
+    sys.stdout.flush()
+    assert buffer.getvalue() == b""
+    assert "\x1b[1;32m" in output.getvalue()
+
+
+def test_display_without_stdout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    A missing stdout (pythonw, closed descriptor) is left to Rich, which discards output.
+    """
+    monkeypatch.setattr(sys, "stdout", None)
+    AsciiArtDisplayer().display()
+
+
+@pytest.mark.parametrize(
+    ("encoding", "name", "value"),
+    [
+        ("utf-8", None, None),
+        ("latin-1", None, None),
+        ("utf-8", "COLUMNS", "40"),
+        ("utf-8", "FORCE_COLOR", "1"),
+        ("utf-8", "TTY_COMPATIBLE", "1"),
+    ],
+)
+def test_prints_as_banner_agrees_with_rich(
+    monkeypatch: pytest.MonkeyPatch, encoding: str, name: str | None, value: str | None
+) -> None:
+    """
+    The shortcut is taken exactly when a default Rich console would print plain text.
+    """
+    if name is not None and value is not None:
+        monkeypatch.setenv(name, value)
+    _redirect_stdout(monkeypatch, encoding)
+    console = Console()
+    rich_prints_banner = (
+        not console.is_terminal
+        and console.encoding.startswith("utf")
+        and console.width > _BANNER_WIDTH
+    )
+    assert _prints_as_banner(sys.stdout) is rich_prints_banner